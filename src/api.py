@@ -2,36 +2,82 @@
 
 import os
 import logging
-from todoist_api_python.api import TodoistAPI
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from todoist_api_python.api_async import TodoistAPIAsync
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("todoist-mcp-server")
 
-def get_api_client():
+# Upper bound on concurrent API requests; the worker thread pool is sized to match
+HTTP_POOL_MAXSIZE = 32
+
+def create_http_session() -> requests.Session:
     """
-    Initialize and return the Todoist API client.
+    Create the HTTP session shared by every Todoist API request.
+
+    The async client runs requests on worker threads, so the pool is sized for
+    concurrent tool calls and keeps connections alive to skip repeated TLS handshakes.
+    Requests are retried with jittered backoff on rate limiting and gateway errors,
+    honoring Retry-After. POST is included because the SDK sends a unique X-Request-Id
+    with each call and Sync API commands carry UUIDs, so the API dedupes replays.
 
     Returns:
-        TodoistAPI: Initialized Todoist API client
+        requests.Session: Session with a pooled, retrying HTTPS adapter mounted
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        backoff_jitter=0.1,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+        # Hand the final error response back so callers see a normal HTTPError
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+def get_api_token() -> str:
+    """
+    Read the Todoist API token from the environment.
+
+    Returns:
+        str: The API token
 
     Raises:
         ValueError: If TODOIST_API_TOKEN environment variable is not set
-        Exception: If client initialization fails
     """
     # Fail fast on missing credentials to provide clear setup guidance
     TODOIST_API_TOKEN = os.getenv("TODOIST_API_TOKEN")
     if not TODOIST_API_TOKEN:
         logger.error("TODOIST_API_TOKEN environment variable is required")
         raise ValueError("TODOIST_API_TOKEN environment variable is required")
+    return TODOIST_API_TOKEN
+
+def get_api_client(session: requests.Session | None = None):
+    """
+    Initialize and return the async Todoist API client.
+
+    Args:
+        session: Shared HTTP session used for all API requests (optional)
+
+    Returns:
+        TodoistAPIAsync: Initialized async Todoist API client
+
+    Raises:
+        ValueError: If TODOIST_API_TOKEN environment variable is not set
+        Exception: If client initialization fails
+    """
+    TODOIST_API_TOKEN = get_api_token()
 
     try:
         # Create client instance - authentication is validated on first API call
-        todoist_client = TodoistAPI(TODOIST_API_TOKEN)
+        todoist_client = TodoistAPIAsync(TODOIST_API_TOKEN, session=session)
         logger.info("Todoist API client initialized successfully")
         return todoist_client
     except Exception as e:
-        logger.error(f"Failed to initialize Todoist client: {e}")
+        logger.error("Failed to initialize Todoist client: %s", e)
         raise
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 
 import logging
-import json
+import requests
 from typing import Optional
 from mcp.server.fastmcp import Context
 
+from .utils import clamp_limit, dumps, tool_handler
+
 logger = logging.getLogger("todoist-mcp-server")
 
-def todoist_get_comment(ctx: Context, comment_id: str) -> str:
+@tool_handler("getting comment")
+async def todoist_get_comment(ctx: Context, comment_id: str) -> str:
     """Get a single comment from Todoist
 
     Args:
@@ -15,22 +18,19 @@ def todoist_get_comment(ctx: Context, comment_id: str) -> str:
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Getting comment with ID: {comment_id}")
+    logger.info("Getting comment with ID: %s", comment_id)
 
-        comment = todoist_client.get_comment(comment_id=comment_id)
+    comment = await todoist_client.get_comment(comment_id=comment_id)
 
-        if not comment:
-            logger.info(f"No comment found with ID: {comment_id}")
-            return f"No comment found with ID: {comment_id}"
+    if not comment:
+        logger.info("No comment found with ID: %s", comment_id)
+        return f"No comment found with ID: {comment_id}"
 
-        logger.info(f"Retrieved comment: {comment.id}")
-        return json.dumps(comment.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error getting comment: {error}")
-        return f"Error getting comment: {str(error)}"
+    logger.info("Retrieved comment: %s", comment.id)
+    return dumps(comment)
 
-def todoist_get_comments(
+@tool_handler("getting comments")
+async def todoist_get_comments(
     ctx: Context,
     project_id: Optional[str] = None,
     task_id: Optional[str] = None,
@@ -49,79 +49,74 @@ def todoist_get_comments(
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        if project_id is None and task_id is None:
-            return "Error: Either project_id or task_id must be provided"
-
-        logger.info(f"Getting comments for project_id: {project_id}, task_id: {task_id}, nmax: {nmax}, limit: {limit}")
-
-        # Early exit for zero requests to avoid unnecessary API calls
-        if nmax is not None:
-            if nmax == 0:
-                logger.info("nmax=0 specified, returning empty result")
-                return []
-            elif nmax < 0:
-                logger.warning(f"Invalid nmax {nmax}, using default of 100")
-                nmax = 100
-
-        if limit > 200:
-            logger.warning(f"Limit {limit} exceeds API maximum of 200, using 200 instead")
-            limit = 200
-        elif limit <= 0:
-            logger.warning(f"Invalid limit {limit}, using default of 200")
-            limit = 200
-
-        # Key optimization: match page size to actual need to reduce API payload
-        effective_limit = limit
-        if nmax is not None and nmax < limit:
-            effective_limit = nmax
-            logger.info(f"Optimized limit from {limit} to {effective_limit} to match nmax")
-
-        params = {"limit": effective_limit}
-        if project_id:
-            params["project_id"] = project_id
-        if task_id:
-            params["task_id"] = task_id
-
-        comments_iterator = todoist_client.get_comments(**params)
-        all_comments = []
-        pages_fetched = 0
-
-        for comment_batch in comments_iterator:
+    if project_id is None and task_id is None:
+        return "Error: Either project_id or task_id must be provided"
+
+    logger.info("Getting comments for project_id: %s, task_id: %s, nmax: %s, limit: %s", project_id, task_id, nmax, limit)
+
+    # Early exit for zero requests to avoid unnecessary API calls
+    if nmax is not None:
+        if nmax == 0:
+            logger.info("nmax=0 specified, returning empty result")
+            return "[]"
+        elif nmax < 0:
+            logger.warning("Invalid nmax %s, using default of 100", nmax)
+            nmax = 100
+
+    limit = clamp_limit(limit)
+
+    # Key optimization: match page size to actual need to reduce API payload
+    effective_limit = limit
+    if nmax is not None and nmax < limit:
+        effective_limit = nmax
+        logger.info("Optimized limit from %s to %s to match nmax", limit, effective_limit)
+
+    params = {"limit": effective_limit}
+    if project_id:
+        params["project_id"] = project_id
+    if task_id:
+        params["task_id"] = task_id
+
+    comments_iterator = await todoist_client.get_comments(**params)
+    pages_fetched = 0
+
+    async def iter_comments():
+        # Yield comments as pages arrive and stop at nmax, so no trimmed copies are kept
+        nonlocal pages_fetched
+        count = 0
+        async for comment_batch in comments_iterator:
             pages_fetched += 1
-            all_comments.extend(comment_batch)
+            logger.info("Fetched page %s with %s comments", pages_fetched, len(comment_batch))
 
-            logger.info(f"Fetched page {pages_fetched} with {len(comment_batch)} comments (total: {len(all_comments)})")
-
-            if nmax is not None and len(all_comments) >= nmax:
-                # Trim excess - rare due to effective_limit optimization, but handles edge cases
-                all_comments = all_comments[:nmax]
-                logger.info(f"Reached nmax of {nmax} comments, stopping pagination")
-                break
+            for comment in comment_batch:
+                yield comment
+                count += 1
+                if nmax is not None and count >= nmax:
+                    logger.info("Reached nmax of %s comments, stopping pagination", nmax)
+                    return
 
             # Todoist API signals end of results by returning fewer items than requested
             if len(comment_batch) < effective_limit:
-                logger.info(f"Received {len(comment_batch)} comments (less than limit {effective_limit}), reached end of results")
-                break
+                logger.info("Received %s comments (less than limit %s), reached end of results", len(comment_batch), effective_limit)
+                return
 
-        if not all_comments:
-            logger.info("No comments found matching the criteria")
-            return "No comments found matching the criteria"
+    all_comments = [comment async for comment in iter_comments()]
 
-        logger.info(f"Retrieved {len(all_comments)} comments total across {pages_fetched} pages")
+    if not all_comments:
+        logger.info("No comments found matching the criteria")
+        return "No comments found matching the criteria"
 
-        if nmax is None:
-            logger.info("Fetched ALL matching comments (nmax=None specified)")
-        elif len(all_comments) == nmax:
-            logger.info(f"Retrieved exactly the requested {nmax} comments")
+    logger.info("Retrieved %s comments total across %s pages", len(all_comments), pages_fetched)
 
-        return json.dumps([comment.to_dict() for comment in all_comments], indent=2, default=str)
+    if nmax is None:
+        logger.info("Fetched ALL matching comments (nmax=None specified)")
+    elif len(all_comments) == nmax:
+        logger.info("Retrieved exactly the requested %s comments", nmax)
 
-    except Exception as error:
-        logger.error(f"Error getting comments: {error}")
-        return f"Error getting comments: {str(error)}"
+    return dumps(all_comments)
 
-def todoist_add_comment(
+@tool_handler("creating comment")
+async def todoist_add_comment(
     ctx: Context,
     content: str,
     project_id: Optional[str] = None,
@@ -140,30 +135,27 @@ def todoist_add_comment(
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        if project_id is None and task_id is None:
-            return "Error: Either project_id or task_id must be provided"
+    if project_id is None and task_id is None:
+        return "Error: Either project_id or task_id must be provided"
 
-        logger.info(f"Creating comment on project_id: {project_id}, task_id: {task_id}")
+    logger.info("Creating comment on project_id: %s, task_id: %s", project_id, task_id)
 
-        comment_params = {"content": content}
+    comment_params = {"content": content}
 
-        if project_id:
-            comment_params["project_id"] = project_id
-        if task_id:
-            comment_params["task_id"] = task_id
-        if uids_to_notify:
-            comment_params["uids_to_notify"] = uids_to_notify
+    if project_id:
+        comment_params["project_id"] = project_id
+    if task_id:
+        comment_params["task_id"] = task_id
+    if uids_to_notify:
+        comment_params["uids_to_notify"] = uids_to_notify
 
-        comment = todoist_client.add_comment(**comment_params)
+    comment = await todoist_client.add_comment(**comment_params)
 
-        logger.info(f"Comment created successfully: {comment.id}")
-        return json.dumps(comment.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error creating comment: {error}")
-        return f"Error creating comment: {str(error)}"
+    logger.info("Comment created successfully: %s", comment.id)
+    return dumps(comment)
 
-def todoist_update_comment(ctx: Context, comment_id: str, content: str) -> str:
+@tool_handler("updating comment")
+async def todoist_update_comment(ctx: Context, comment_id: str, content: str) -> str:
     """Update an existing comment in Todoist
 
     Args:
@@ -172,41 +164,44 @@ def todoist_update_comment(ctx: Context, comment_id: str, content: str) -> str:
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Updating comment with ID: {comment_id}")
-
-        updated_comment = todoist_client.update_comment(comment_id=comment_id, content=content)
+    logger.info("Updating comment with ID: %s", comment_id)
 
-        logger.info(f"Comment updated successfully: {comment_id}")
-        return json.dumps(updated_comment.to_dict(), indent=2, default=str)
+    updated_comment = await todoist_client.update_comment(comment_id=comment_id, content=content)
 
-    except Exception as error:
-        logger.error(f"Error updating comment: {error}")
-        return f"Error updating comment: {str(error)}"
+    logger.info("Comment updated successfully: %s", comment_id)
+    return dumps(updated_comment)
 
-def todoist_delete_comment(ctx: Context, comment_id: str) -> str:
+@tool_handler("deleting comment")
+async def todoist_delete_comment(ctx: Context, comment_id: str, include_preview: bool = False) -> str:
     """Delete a comment from Todoist
 
     Args:
         comment_id: ID of the comment to delete
+        include_preview: Fetch the comment first to include a content preview in the result (default: False)
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
     try:
-        logger.info(f"Deleting comment with ID: {comment_id}")
-
-        try:
-            comment = todoist_client.get_comment(comment_id=comment_id)
-            comment_preview = comment.content[:50] + "..." if len(comment.content) > 50 else comment.content
-        except Exception as error:
-            logger.warning(f"Error getting comment with ID: {comment_id}: {error}")
-            return f"Could not verify comment with ID: {comment_id}. Deletion aborted."
-
-        is_success = todoist_client.delete_comment(comment_id=comment_id)
-
-        logger.info(f"Comment deleted successfully: {comment_id}")
+        logger.info("Deleting comment with ID: %s", comment_id)
+
+        comment_preview = None
+        if include_preview:
+            try:
+                comment = await todoist_client.get_comment(comment_id=comment_id)
+                comment_preview = comment.content[:50] + "..." if len(comment.content) > 50 else comment.content
+            except Exception as error:
+                logger.warning("Error getting comment with ID: %s: %s", comment_id, error)
+                return f"Could not verify comment with ID: {comment_id}. Deletion aborted."
+
+        await todoist_client.delete_comment(comment_id=comment_id)
+
+        logger.info("Comment deleted successfully: %s", comment_id)
+        if comment_preview is None:
+            return f"Successfully deleted comment (ID: {comment_id})"
         return f"Successfully deleted comment: '{comment_preview}' (ID: {comment_id})"
 
-    except Exception as error:
-        logger.error(f"Error deleting comment: {error}")
-        return f"Error deleting comment: {str(error)}"
+    except requests.HTTPError as error:
+        if error.response is not None and error.response.status_code == 404:
+            logger.warning("No comment found with ID: %s", comment_id)
+            return f"Comment not found (ID: {comment_id})"
+        raise
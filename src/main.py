@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
+import logging.handlers
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import requests
 from mcp.server.fastmcp import FastMCP
-from todoist_api_python.api import TodoistAPI
+from todoist_api_python.api_async import TodoistAPIAsync
 
-from .api import get_api_client
+from .api import HTTP_POOL_MAXSIZE, create_http_session, get_api_client, get_api_token
+from .sync import SyncCommandBatcher
+from .utils import BatchLoader, TTLCache
 from .projects import (
     todoist_get_projects,
     todoist_get_project,
@@ -28,11 +35,15 @@ from .tasks import (
     todoist_get_tasks,
     todoist_filter_tasks,
     todoist_add_task,
+    todoist_add_tasks,
     todoist_update_task,
     todoist_complete_task,
     todoist_uncomplete_task,
     todoist_move_task,
+    todoist_move_tasks,
     todoist_delete_task,
+    todoist_delete_tasks,
+    todoist_bulk_close_tasks,
 )
 
 from .comments import (
@@ -43,26 +54,45 @@ from .comments import (
     todoist_delete_comment,
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("todoist-mcp-server")
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TodoistContext:
     """Type-safe container for shared application context across MCP tool calls"""
-    todoist_client: TodoistAPI
+    todoist_client: TodoistAPIAsync
+    session: requests.Session
+    # Coalesces Sync API write commands issued close together into one request
+    sync_batcher: SyncCommandBatcher
+    # Short-lived list caches; mutating tools clear them so reads never outlive a write
+    projects_cache: TTLCache = field(default_factory=lambda: TTLCache(maxsize=4, ttl=30))
+    tasks_cache: TTLCache = field(default_factory=lambda: TTLCache(maxsize=32, ttl=30))
+    sections_cache: TTLCache = field(default_factory=lambda: TTLCache(maxsize=128, ttl=30))
+    # Single tasks by ID for mutation pre-checks; kept current by the task handlers themselves
+    task_lookup_cache: TTLCache = field(default_factory=lambda: TTLCache(maxsize=512, ttl=30))
+    # Section names by ID, only used to label responses, so entries can live longer
+    section_names: TTLCache = field(default_factory=lambda: TTLCache(maxsize=1024, ttl=300))
+    # Coalesce bursts of single-object lookups into one list fetch
+    project_loader: BatchLoader = field(default_factory=BatchLoader)
+    section_loader: BatchLoader = field(default_factory=BatchLoader)
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[TodoistContext]:
     """Manage application lifecycle with proper resource initialization and cleanup"""
+    # The async client runs each blocking request in the loop's default executor, which
+    # defaults to min(32, CPUs + 4) threads; size it to the connection pool instead so small
+    # machines don't queue requests the pool could serve
+    executor = ThreadPoolExecutor(max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix="todoist-api")
+    asyncio.get_running_loop().set_default_executor(executor)
+    # One HTTP session for the whole server so concurrent tool calls share connections
+    session = create_http_session()
     try:
         # Initialize API client once and share across all tool invocations for efficiency
-        todoist_client = get_api_client()
-        yield TodoistContext(todoist_client=todoist_client)
+        todoist_client = get_api_client(session=session)
+        sync_batcher = SyncCommandBatcher(session, get_api_token())
+        yield TodoistContext(todoist_client=todoist_client, session=session, sync_batcher=sync_batcher)
     finally:
-        # Placeholder for any needed cleanup - current client doesn't require explicit cleanup
+        session.close()
+        executor.shutdown(wait=False, cancel_futures=True)
         logger.info("Shutting down Todoist MCP Server")
 
 # Initialize MCP server with lifecycle management
@@ -85,11 +115,15 @@ mcp.tool()(todoist_get_task)
 mcp.tool()(todoist_get_tasks)
 mcp.tool()(todoist_filter_tasks)
 mcp.tool()(todoist_add_task)
+mcp.tool()(todoist_add_tasks)
 mcp.tool()(todoist_update_task)
 mcp.tool()(todoist_complete_task)
 mcp.tool()(todoist_uncomplete_task)
 mcp.tool()(todoist_move_task)
+mcp.tool()(todoist_move_tasks)
 mcp.tool()(todoist_delete_task)
+mcp.tool()(todoist_delete_tasks)
+mcp.tool()(todoist_bulk_close_tasks)
 
 mcp.tool()(todoist_get_comment)
 mcp.tool()(todoist_get_comments)
@@ -98,9 +132,32 @@ mcp.tool()(todoist_update_comment)
 mcp.tool()(todoist_delete_comment)
 
 def main():
-    logger.info("Starting Todoist MCP Server")
-    # Use stdio transport for Claude Desktop integration
-    mcp.run(transport='stdio')
+    # Creating the FastMCP server already put a RichHandler on the root logger, so
+    # force=True is needed to replace it with this format instead of being a no-op
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=True
+    )
+    # Now that the format above replaces FastMCP's handler, no handler reads thread/process
+    # fields, so skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Hand records to a background thread so tool calls never block on writing to stderr;
+    # the listener drives the stderr StreamHandler basicConfig just installed
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+
+    try:
+        logger.info("Starting Todoist MCP Server")
+        # Use stdio transport for Claude Desktop integration
+        mcp.run(transport='stdio')
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
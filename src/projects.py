@@ -1,64 +1,91 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
-import json
+import requests
 from typing import Optional
 from mcp.server.fastmcp import Context
 
+from .utils import dumps, tool_handler
+
 logger = logging.getLogger("todoist-mcp-server")
 
-def todoist_get_projects(ctx: Context) -> str:
-    """Get all projects from the user's Todoist account
+_VIEW_STYLES = frozenset(("list", "board", "calendar"))
+
+def _cached_project(ctx: Context, project_id: str):
+    """Return the project from a still-fresh projects list cache, or None without fetching"""
+    _, projects_by_id = ctx.request_context.lifespan_context.projects_cache.get("projects", ((), {}))
+    return projects_by_id.get(project_id)
+
+async def _get_projects(ctx: Context):
+    """Return (projects, {id: project}) for every project, cached together as one entry
+
+    The list and its ID index share a cache key so they expire and are invalidated together.
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
+    projects_cache = ctx.request_context.lifespan_context.projects_cache
 
-    try:
-        logger.info("Getting all projects")
-
-        # Consume iterator to flatten paginated results into single list
-        projects_iterator = todoist_client.get_projects()
+    async def fetch_projects():
+        # Consume iterator to flatten paginated results into single list; the iterator
+        # stops on its own when the API returns no next cursor
+        projects_iterator = await todoist_client.get_projects(limit=200)
         all_projects = []
 
-        for project_batch in projects_iterator:
+        async for project_batch in projects_iterator:
             all_projects.extend(project_batch)
-            # Break early when partial batch indicates end of results
-            if len(project_batch) < 200:
-                break
 
-        if not all_projects:
-            logger.info("No projects found")
-            return "No projects found in your Todoist account"
+        # Index by ID alongside the list so later tools can resolve a project without a request
+        return all_projects, {project.id: project for project in all_projects}
 
-        logger.info(f"Retrieved {len(all_projects)} projects")
-        return json.dumps([project.to_dict() for project in all_projects], indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error getting projects: {error}")
-        return f"Error getting projects: {str(error)}"
+    return await projects_cache.get_or_fetch("projects", fetch_projects)
 
-def todoist_get_project(ctx: Context, project_id: str) -> str:
+@tool_handler("getting projects")
+async def todoist_get_projects(ctx: Context) -> str:
+    """Get all projects from the user's Todoist account
+    """
+    logger.info("Getting all projects")
+
+    all_projects, _ = await _get_projects(ctx)
+
+    if not all_projects:
+        logger.info("No projects found")
+        return "No projects found in your Todoist account"
+
+    logger.info("Retrieved %s projects", len(all_projects))
+    return dumps(all_projects)
+
+@tool_handler("getting project")
+async def todoist_get_project(ctx: Context, project_id: str) -> str:
     """Get a single project from Todoist
 
     Args:
         project_id: ID of the project to retrieve
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
+    project_loader = ctx.request_context.lifespan_context.project_loader
 
-    try:
-        logger.info(f"Getting project with ID: {project_id}")
+    async def load_one(key):
+        return await todoist_client.get_project(project_id=key)
 
-        project = todoist_client.get_project(project_id=project_id)
+    async def load_many(keys):
+        # One (cached) list fetch answers every active project requested in the same window;
+        # the loader looks up archived or unknown IDs individually
+        _, projects_by_id = await _get_projects(ctx)
+        return projects_by_id
 
-        if not project:
-            logger.info(f"No project found with ID: {project_id}")
-            return f"No project found with ID: {project_id}"
+    logger.info("Getting project with ID: %s", project_id)
+
+    project = _cached_project(ctx, project_id) or await project_loader.load(project_id, load_one, load_many)
 
-        logger.info(f"Retrieved project: {project.id}")
-        return json.dumps(project.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error getting project: {error}")
-        return f"Error getting project: {str(error)}"
+    if not project:
+        logger.info("No project found with ID: %s", project_id)
+        return f"No project found with ID: {project_id}"
 
-def todoist_add_project(
+    logger.info("Retrieved project: %s", project.id)
+    return dumps(project)
+
+@tool_handler("creating project")
+async def todoist_add_project(
     ctx: Context,
     name: str,
     color: Optional[str] = None,
@@ -77,33 +104,26 @@ def todoist_add_project(
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Creating project: {name}")
+    logger.info("Creating project: %s", name)
 
-        project_params = {
-            "name": name
-        }
+    # Empty strings and unsupported view styles are treated as not provided to prevent API errors
+    optional_params = {
+        "color": color or None,
+        "parent_id": parent_id or None,
+        "is_favorite": is_favorite,
+        "view_style": view_style if view_style in _VIEW_STYLES else None,
+    }
+    project_params = {"name": name}
+    project_params.update((key, value) for key, value in optional_params.items() if value is not None)
+
+    project = await todoist_client.add_project(**project_params)
+    ctx.request_context.lifespan_context.projects_cache.clear()
+
+    logger.info("Project created successfully: %s", project.id)
+    return dumps(project)
 
-        # Add optional parameters efficiently
-        if color:
-            project_params["color"] = color
-        if parent_id:
-            project_params["parent_id"] = parent_id
-        if is_favorite is not None:
-            project_params["is_favorite"] = is_favorite
-        # Validate view_style against API-supported values to prevent errors
-        if view_style and view_style in ["list", "board", "calendar"]:
-            project_params["view_style"] = view_style
-
-        project = todoist_client.add_project(**project_params)
-
-        logger.info(f"Project created successfully: {project.id}")
-        return json.dumps(project.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error creating project: {error}")
-        return f"Error creating project: {str(error)}"
-
-def todoist_update_project(
+@tool_handler("updating project")
+async def todoist_update_project(
     ctx: Context,
     project_id: str,
     name: Optional[str] = None,
@@ -123,40 +143,35 @@ def todoist_update_project(
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
     try:
-        logger.info(f"Updating project with ID: {project_id}")
-
-        # Pre-fetch for validation and meaningful error messages
-        try:
-            project = todoist_client.get_project(project_id=project_id)
-            original_name = project.name
-        except Exception as error:
-            logger.warning(f"Error getting project with ID: {project_id}: {error}")
-            return f"Could not verify project with ID: {project_id}. Update aborted."
-
-        update_params = {}
-        if name:
-            update_params["name"] = name
-        if color:
-            update_params["color"] = color
-        if is_favorite is not None:
-            update_params["is_favorite"] = is_favorite
-        # Same validation as create to maintain consistency
-        if view_style and view_style in ["list", "board", "calendar"]:
-            update_params["view_style"] = view_style
+        logger.info("Updating project with ID: %s", project_id)
+
+        # Same filtering as create to maintain consistency
+        optional_params = {
+            "name": name or None,
+            "color": color or None,
+            "is_favorite": is_favorite,
+            "view_style": view_style if view_style in _VIEW_STYLES else None,
+        }
+        update_params = {key: value for key, value in optional_params.items() if value is not None}
 
         if len(update_params) == 0:
-            return f"No update parameters provided for project: {original_name} (ID: {project_id})"
+            return f"No update parameters provided for project (ID: {project_id})"
 
-        updated_project = todoist_client.update_project(project_id, **update_params)
+        updated_project = await todoist_client.update_project(project_id, **update_params)
+        ctx.request_context.lifespan_context.projects_cache.clear()
 
-        logger.info(f"Project updated successfully: {project_id}")
-        return json.dumps(updated_project.to_dict(), indent=2, default=str)
+        logger.info("Project updated successfully: %s", project_id)
+        return dumps(updated_project)
 
-    except Exception as error:
-        logger.error(f"Error updating project: {error}")
-        return f"Error updating project: {str(error)}"
+    except requests.HTTPError as error:
+        # The API validates the ID itself, so a missing project surfaces here instead of via a pre-fetch
+        if error.response is not None and error.response.status_code == 404:
+            logger.warning("No project found with ID: %s", project_id)
+            return f"No project found with ID: {project_id}"
+        raise
 
-def todoist_delete_project(ctx: Context, project_id: str) -> str:
+@tool_handler("deleting project")
+async def todoist_delete_project(ctx: Context, project_id: str) -> str:
     """Deletes a project from the user's Todoist account
 
     Args:
@@ -164,22 +179,36 @@ def todoist_delete_project(ctx: Context, project_id: str) -> str:
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Deleting project with ID: {project_id}")
-
-        # Capture project name for meaningful success/failure messages
-        try:
-            project = todoist_client.get_project(project_id=project_id)
-            project_name = project.name
-        except Exception as error:
-            logger.warning(f"Error getting project with ID: {project_id}: {error}")
-            return f"Could not verify project with ID: {project_id}. Deletion aborted."
-
-        is_success = todoist_client.delete_project(project_id=project_id)
-
-        logger.info(f"Project deleted successfully: {project_id} ({project_name})")
-        return f"Successfully deleted project: {project_name} (ID: {project_id})"
-
-    except Exception as error:
-        logger.error(f"Error deleting project: {error}")
-        return f"Error deleting project: {str(error)}"
+    logger.info("Deleting project with ID: %s", project_id)
+
+    # Take the name for the response from the cache when possible; otherwise fetch it
+    # concurrently with the delete instead of before it
+    project_result = _cached_project(ctx, project_id)
+    if project_result is not None:
+        await todoist_client.delete_project(project_id=project_id)
+    else:
+        project_result, delete_result = await asyncio.gather(
+            todoist_client.get_project(project_id=project_id),
+            todoist_client.delete_project(project_id=project_id),
+            return_exceptions=True,
+        )
+        if isinstance(delete_result, Exception):
+            raise delete_result
+
+    # The lookup can lose the race with the delete; the deletion itself still succeeded
+    project_name = None
+    if isinstance(project_result, Exception):
+        logger.warning("Error getting project with ID: %s: %s", project_id, project_result)
+    else:
+        project_name = project_result.name
+
+    # Deleting a project also deletes its sections and tasks
+    ctx.request_context.lifespan_context.projects_cache.clear()
+    ctx.request_context.lifespan_context.sections_cache.clear()
+    ctx.request_context.lifespan_context.tasks_cache.clear()
+    ctx.request_context.lifespan_context.task_lookup_cache.clear()
+
+    logger.info("Project deleted successfully: %s (%s)", project_id, project_name)
+    if project_name is None:
+        return f"Successfully deleted project (ID: {project_id})"
+    return f"Successfully deleted project: {project_name} (ID: {project_id})"
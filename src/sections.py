@@ -1,66 +1,102 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
-import json
+from dataclasses import fields
+from operator import attrgetter
 from typing import Optional
 from mcp.server.fastmcp import Context
+from todoist_api_python.models import Section
+
+from .utils import dumps, tool_handler
 
 logger = logging.getLogger("todoist-mcp-server")
 
-def todoist_get_sections(ctx: Context, project_id: Optional[str] = None) -> str:
+_SECTION_COLUMNS = [f.name for f in fields(Section)]
+_section_row = attrgetter(*_SECTION_COLUMNS)
+
+def _remember_section_names(ctx: Context, sections) -> None:
+    """Record section names so delete responses can be labeled without a lookup request"""
+    section_names = ctx.request_context.lifespan_context.section_names
+    for section in sections:
+        section_names.set(section.id, section.name)
+
+@tool_handler("getting sections")
+async def todoist_get_sections(ctx: Context, project_id: Optional[str] = None, compact: bool = False) -> str:
     """Get all sections from the user's Todoist account
 
     Args:
         project_id: Filter sections by project ID (optional)
+        compact: Return {"columns": [...], "rows": [[...], ...]} instead of one object per section,
+            which avoids repeating every key (default: False)
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
+    sections_cache = ctx.request_context.lifespan_context.sections_cache
 
-    try:
-        logger.info(f"Getting sections{' for project ID: ' + project_id if project_id else ''}")
-
+    async def fetch_sections():
         # Use same pagination pattern as projects for consistency
-        sections_iterator = todoist_client.get_sections(project_id=project_id)
+        sections_iterator = await todoist_client.get_sections(project_id=project_id, limit=200)
         all_sections = []
 
-        for section_batch in sections_iterator:
+        async for section_batch in sections_iterator:
             all_sections.extend(section_batch)
-            if len(section_batch) < 200:
-                break
 
-        if not all_sections:
-            logger.info("No sections found")
-            return "No sections found" + (f" in project ID: {project_id}" if project_id else "")
+        return all_sections
 
-        logger.info(f"Retrieved {len(all_sections)} sections")
-        return json.dumps([section.to_dict() for section in all_sections], indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error getting sections: {error}")
-        return f"Error getting sections: {str(error)}"
+    logger.info("Getting sections for project ID: %s", project_id)
 
-def todoist_get_section(ctx: Context, section_id: str) -> str:
+    all_sections = await sections_cache.get_or_fetch(("sections", project_id), fetch_sections)
+
+    if not all_sections:
+        logger.info("No sections found")
+        return "No sections found" + (f" in project ID: {project_id}" if project_id else "")
+
+    _remember_section_names(ctx, all_sections)
+    logger.info("Retrieved %s sections", len(all_sections))
+    if compact:
+        # orjson encodes the tuples from attrgetter as arrays
+        return dumps({"columns": _SECTION_COLUMNS, "rows": list(map(_section_row, all_sections))})
+    return dumps(all_sections)
+
+@tool_handler("getting section")
+async def todoist_get_section(ctx: Context, section_id: str) -> str:
     """Get a single section from Todoist
 
     Args:
         section_id: ID of the section to retrieve
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
+    section_loader = ctx.request_context.lifespan_context.section_loader
+    sections_cache = ctx.request_context.lifespan_context.sections_cache
+
+    async def load_one(key):
+        return await todoist_client.get_section(section_id=key)
 
-    try:
-        logger.info(f"Getting section with ID: {section_id}")
+    async def load_many(keys):
+        # One list fetch across all projects answers every active section requested in the same
+        # window; the loader looks up sections of archived projects or unknown IDs individually
+        sections_iterator = await todoist_client.get_sections(limit=200)
+        return {section.id: section async for section_batch in sections_iterator for section in section_batch}
 
-        section = todoist_client.get_section(section_id=section_id)
+    logger.info("Getting section with ID: %s", section_id)
 
-        if not section:
-            logger.info(f"No section found with ID: {section_id}")
-            return f"No section found with ID: {section_id}"
+    # Not get_or_fetch: a missing section (None) shouldn't be cached, and the loader already coalesces
+    section = sections_cache.get(("section", section_id))
+    if section is None:
+        section = await section_loader.load(section_id, load_one, load_many)
+        if section:
+            sections_cache.set(("section", section_id), section)
 
-        logger.info(f"Retrieved section: {section.id}")
-        return json.dumps(section.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error getting section: {error}")
-        return f"Error getting section: {str(error)}"
+    if not section:
+        logger.info("No section found with ID: %s", section_id)
+        return f"No section found with ID: {section_id}"
 
-def todoist_add_section(
+    _remember_section_names(ctx, [section])
+    logger.info("Retrieved section: %s", section.id)
+    return dumps(section)
+
+@tool_handler("creating section")
+async def todoist_add_section(
     ctx: Context,
     name: str,
     project_id: str,
@@ -75,26 +111,25 @@ def todoist_add_section(
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Creating section '{name}' in project ID: {project_id}")
+    logger.info("Creating section '%s' in project ID: %s", name, project_id)
 
-        section_params = {
-            "name": name,
-            "project_id": project_id
-        }
+    section_params = {
+        "name": name,
+        "project_id": project_id
+    }
 
-        if order is not None:
-            section_params["order"] = order
+    if order is not None:
+        section_params["order"] = order
 
-        section = todoist_client.add_section(**section_params)
+    section = await todoist_client.add_section(**section_params)
+    ctx.request_context.lifespan_context.sections_cache.clear()
 
-        logger.info(f"Section created successfully: {section.id}")
-        return json.dumps(section.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error creating section: {error}")
-        return f"Error creating section: {str(error)}"
+    _remember_section_names(ctx, [section])
+    logger.info("Section created successfully: %s", section.id)
+    return dumps(section)
 
-def todoist_update_section(ctx: Context, section_id: str, name: str) -> str:
+@tool_handler("updating section")
+async def todoist_update_section(ctx: Context, section_id: str, name: str) -> str:
     """Updates a section in Todoist
 
     Args:
@@ -103,27 +138,17 @@ def todoist_update_section(ctx: Context, section_id: str, name: str) -> str:
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Updating section with ID: {section_id}")
-
-        # Capture original name for informative response messages
-        try:
-            section = todoist_client.get_section(section_id=section_id)
-            original_name = section.name
-        except Exception as error:
-            logger.warning(f"Error getting section with ID: {section_id}: {error}")
-            return f"Could not verify section with ID: {section_id}. Update aborted."
+    logger.info("Updating section with ID: %s", section_id)
 
-        updated_section = todoist_client.update_section(section_id=section_id, name=name)
+    updated_section = await todoist_client.update_section(section_id=section_id, name=name)
+    ctx.request_context.lifespan_context.sections_cache.clear()
 
-        logger.info(f"Section updated successfully: {section_id}")
-        return json.dumps(updated_section.to_dict(), indent=2, default=str)
+    _remember_section_names(ctx, [updated_section])
+    logger.info("Section updated successfully: %s", section_id)
+    return dumps(updated_section)
 
-    except Exception as error:
-        logger.error(f"Error updating section: {error}")
-        return f"Error updating section: {str(error)}"
-
-def todoist_delete_section(ctx: Context, section_id: str) -> str:
+@tool_handler("deleting section")
+async def todoist_delete_section(ctx: Context, section_id: str) -> str:
     """Deletes a section from Todoist
 
     Args:
@@ -131,21 +156,37 @@ def todoist_delete_section(ctx: Context, section_id: str) -> str:
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Deleting section with ID: {section_id}")
-
-        try:
-            section = todoist_client.get_section(section_id=section_id)
-            section_name = section.name
-        except Exception as error:
-            logger.warning(f"Error getting section with ID: {section_id}: {error}")
-            return f"Could not verify section with ID: {section_id}. Deletion aborted."
-
-        is_success = todoist_client.delete_section(section_id=section_id)
-
-        logger.info(f"Section deleted successfully: {section_id}")
-        return f"Successfully deleted section: {section_name} (ID: {section_id})"
-
-    except Exception as error:
-        logger.error(f"Error deleting section: {error}")
-        return f"Error deleting section: {str(error)}"
+    logger.info("Deleting section with ID: %s", section_id)
+
+    section_names = ctx.request_context.lifespan_context.section_names
+    sync_batcher = ctx.request_context.lifespan_context.sync_batcher
+
+    # Deletes go through the Sync API batcher so bulk deletions share one request.
+    # Use the remembered name when possible; otherwise fetch it concurrently with the delete
+    section_name = section_names.get(section_id)
+    if section_name is not None:
+        await sync_batcher.submit("section_delete", {"id": section_id})
+    else:
+        section_result, delete_result = await asyncio.gather(
+            todoist_client.get_section(section_id=section_id),
+            sync_batcher.submit("section_delete", {"id": section_id}),
+            return_exceptions=True,
+        )
+        if isinstance(delete_result, Exception):
+            raise delete_result
+        # The lookup can lose the race with the delete; the deletion itself still succeeded
+        if isinstance(section_result, Exception):
+            logger.warning("Error getting section with ID: %s: %s", section_id, section_result)
+        else:
+            section_name = section_result.name
+
+    section_names.pop(section_id)
+    ctx.request_context.lifespan_context.sections_cache.clear()
+    # Deleting a section also deletes its tasks
+    ctx.request_context.lifespan_context.tasks_cache.clear()
+    ctx.request_context.lifespan_context.task_lookup_cache.clear()
+
+    logger.info("Section deleted successfully: %s", section_id)
+    if section_name is None:
+        return f"Successfully deleted section (ID: {section_id})"
+    return f"Successfully deleted section: {section_name} (ID: {section_id})"
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any
+
+import requests
+from todoist_api_python._core.endpoints import get_api_url
+from todoist_api_python._core.http_requests import TIMEOUT
+
+from .utils import RateLimiter
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib codec if the C extension is unavailable
+    orjson = None
+
+logger = logging.getLogger("todoist-mcp-server")
+
+SYNC_URL = get_api_url("sync")
+# The Sync API accepts at most 100 commands per request
+MAX_COMMANDS = 100
+# Stay under the Sync API's per-minute request limit instead of waiting out 429 responses
+REQUESTS_PER_MINUTE = 45
+
+class SyncCommandError(Exception):
+    """Raised when the Sync API rejects an individual command"""
+
+    def __init__(self, status: Any):
+        self.status = status
+        message = status.get("error", status) if isinstance(status, dict) else status
+        super().__init__(message)
+
+class SyncCommandBatcher:
+    """Coalesce Sync API commands issued within a short window into a single POST
+
+    Each caller awaits its own command's outcome: the created object's real ID for
+    commands with a temp_id, None for other successful commands, or SyncCommandError.
+    Commands within a request keep submission order, so later ones can reference earlier temp IDs.
+    """
+
+    def __init__(self, session: requests.Session, token: str, delay: float = 0.025):
+        self.session = session
+        self.token = token
+        # The token is fixed for the batcher's lifetime, so build the header once
+        self._headers = {"Authorization": f"Bearer {token}"}
+        self.delay = delay
+        self._rate_limiter = RateLimiter(REQUESTS_PER_MINUTE, 60)
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        # Latest queued command per object ID, as ((command_type, args JSON), future)
+        self._latest_by_id: dict[str, tuple[tuple[str, str], asyncio.Future]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._sends: set[asyncio.Task] = set()
+
+    async def submit(self, command_type: str, args: dict, temp_id: str | None = None) -> str | None:
+        future = self._enqueue(command_type, args, temp_id)
+        self._schedule()
+        # Shield so a cancelled caller doesn't cancel the future the send will resolve
+        return await asyncio.shield(future)
+
+    async def submit_many(self, commands: list[tuple[str, dict, str | None]]) -> list[Any]:
+        """Submit (command_type, args, temp_id) commands that must share one request
+
+        Use this when commands reference each other's temp IDs, which the API only resolves
+        within a single request. Returns one outcome per command, with SyncCommandError
+        instances in place of failures.
+        """
+        if len(commands) > MAX_COMMANDS:
+            raise ValueError(f"At most {MAX_COMMANDS} commands can be sent in one request")
+        # Send what is already queued first if the group wouldn't fit in the same batch
+        if len(self._pending) + len(commands) > MAX_COMMANDS:
+            self._flush()
+        futures = [self._enqueue(*command) for command in commands]
+        self._schedule()
+        return await asyncio.gather(*(asyncio.shield(future) for future in futures), return_exceptions=True)
+
+    def _enqueue(self, command_type: str, args: dict, temp_id: str | None) -> asyncio.Future:
+        # Commands without a temp_id act on existing objects, so one identical to the latest
+        # command queued for the same object (e.g. a client retrying a move) has the same
+        # effect; share its outcome. An older match is re-sent to keep the order of writes.
+        object_id = args.get("id") if temp_id is None else None
+        key = None
+        if object_id is not None:
+            key = (command_type, json.dumps(args, sort_keys=True))
+            latest = self._latest_by_id.get(object_id)
+            if latest is not None and latest[0] == key:
+                logger.info("Sharing queued %s command with an identical request", command_type)
+                return latest[1]
+
+        command = {"type": command_type, "uuid": uuid.uuid4().hex, "args": args}
+        if temp_id is not None:
+            command["temp_id"] = temp_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((command, future))
+        if object_id is not None:
+            self._latest_by_id[object_id] = (key, future)
+        return future
+
+    def _schedule(self) -> None:
+        if len(self._pending) >= MAX_COMMANDS:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.delay, self._flush)
+
+    def _flush(self) -> None:
+        # Take the batch synchronously so commands submitted after this point start a new one
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self._latest_by_id = {}
+        if batch:
+            # Hold a reference so the pending send isn't garbage collected mid-flight
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+
+    async def _send(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        try:
+            await self._rate_limiter.acquire()
+            logger.info("Sending %s Sync API commands in one request", len(batch))
+            result = await asyncio.to_thread(self._post, [command for command, _ in batch])
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        sync_status = result.get("sync_status", {})
+        temp_id_mapping = result.get("temp_id_mapping", {})
+        for command, future in batch:
+            if future.done():
+                continue
+            status = sync_status.get(command["uuid"])
+            if status == "ok":
+                future.set_result(temp_id_mapping.get(command.get("temp_id")))
+            else:
+                future.set_exception(SyncCommandError(status))
+
+    def _post(self, commands: list[dict]) -> dict:
+        response = self.session.post(
+            SYNC_URL,
+            headers=self._headers,
+            # Same (connect, read) limits as the SDK's REST calls, so a stalled connection fails
+            # the batch instead of holding an executor thread and its callers forever
+            timeout=TIMEOUT,
+            # The endpoint takes commands as a form field, so the JSON still gets form-encoded
+            data={"commands": orjson.dumps(commands) if orjson is not None else json.dumps(commands)},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content) if orjson is not None else response.json()
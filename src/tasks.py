@@ -1,13 +1,185 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
-import json
+import re
+import uuid
+import requests
+from datetime import date, datetime
+from functools import partial
+from itertools import islice
 from typing import Optional, Dict, Any
 from mcp.server.fastmcp import Context
+from todoist_api_python._core.utils import format_datetime
+
+from .sync import MAX_COMMANDS
+from .utils import bounded_gather, clamp_limit, dumps, tool_handler
 
 logger = logging.getLogger("todoist-mcp-server")
 
-def todoist_add_task(
+_VALID_PRIORITIES = frozenset((1, 2, 3, 4))
+_DURATION_UNITS = frozenset(("minute", "day"))
+_MOVE_DESTINATIONS = ("parent_id", "section_id", "project_id")
+
+_parse_date = date.fromisoformat
+_parse_datetime = datetime.fromisoformat
+# fromisoformat also accepts non-RFC3339 shapes (date only, no separators), so check the shape first
+_RFC3339_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})")
+
+def _coerce_date(value):
+    """Parse a YYYY-MM-DD string into a date; the API client expects date objects"""
+    return _parse_date(value) if type(value) is str else value
+
+def _coerce_datetime(value):
+    """Parse an RFC3339 string into a datetime; the API client expects datetime objects
+
+    fromisoformat accepts a trailing 'Z' on Python 3.11+, so UTC strings need no rewriting.
+    """
+    if type(value) is not str:
+        return value
+    if not _RFC3339_RE.fullmatch(value):
+        raise ValueError(f"Invalid due_datetime '{value}', expected RFC3339 like 2025-01-31T09:00:00Z")
+    return _parse_datetime(value)
+
+def _invalidate_task_caches(ctx: Context, *task_ids: str, subtasks: bool = False) -> None:
+    """Drop cached task lists after a write, plus the cached lookups of the tasks it changed
+
+    Lists are cleared wholesale: a task's project, section or filter membership can change
+    in ways its ID alone doesn't reveal. Pass subtasks=True when the write also changes the
+    tasks' descendants (complete, delete, move); the lookup cache has no parent index, so
+    it is then cleared wholesale too.
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+    lifespan_context.tasks_cache.clear()
+    if subtasks:
+        lifespan_context.task_lookup_cache.clear()
+        return
+    for task_id in task_ids:
+        lifespan_context.task_lookup_cache.pop(task_id)
+
+def _task_label(task_content, task_id):
+    """Describe a task for result messages, naming it when its content is known"""
+    if task_content is None:
+        return f"task (ID: {task_id})"
+    return f"task: {task_content} (ID: {task_id})"
+
+def _remember_tasks(ctx: Context, tasks) -> None:
+    """Record listed tasks so a follow-up mutation by ID can skip its pre-check request"""
+    task_lookup_cache = ctx.request_context.lifespan_context.task_lookup_cache
+    for task in tasks:
+        task_lookup_cache.set(task.id, task)
+
+async def _get_tasks_cached(ctx: Context, cache_key, fetch_tasks):
+    """Return a task list from the tasks cache, recording its tasks for later lookups by ID
+
+    Tasks are only recorded if no write invalidated the task caches since the list was
+    fetched, so a list fetch racing a write can't put stale tasks back into the lookup cache.
+    """
+    tasks_cache = ctx.request_context.lifespan_context.tasks_cache
+    generation = tasks_cache.generation
+    all_tasks = await tasks_cache.get_or_fetch(cache_key, fetch_tasks)
+    if tasks_cache.generation == generation:
+        _remember_tasks(ctx, all_tasks)
+    return all_tasks
+
+async def _get_task_cached(ctx: Context, task_id: str):
+    """Return a task by ID, reusing one fetched in the last few seconds
+
+    Mutating handlers use this for their pre-check, so e.g. update-then-complete on the same
+    task costs one lookup. Handlers refresh or drop the entry after they change the task.
+    """
+    todoist_client = ctx.request_context.lifespan_context.todoist_client
+    task_lookup_cache = ctx.request_context.lifespan_context.task_lookup_cache
+    return await task_lookup_cache.get_or_fetch(task_id, lambda: todoist_client.get_task(task_id=task_id))
+
+async def _run_with_task_content(ctx: Context, task_id: str, mutation):
+    """Await the mutation coroutine, getting the task's content for the result message on the side
+
+    The content comes from the task lookup cache when possible; otherwise it is fetched
+    concurrently with the mutation rather than before it. Returns (mutation result, content),
+    with content None if the lookup failed (e.g. it lost the race with a delete).
+    """
+    task = ctx.request_context.lifespan_context.task_lookup_cache.get(task_id)
+    if task is not None:
+        return await mutation, task.content
+
+    todoist_client = ctx.request_context.lifespan_context.todoist_client
+    task_result, mutation_result = await asyncio.gather(
+        todoist_client.get_task(task_id=task_id),
+        mutation,
+        return_exceptions=True,
+    )
+    if isinstance(mutation_result, Exception):
+        raise mutation_result
+    if isinstance(task_result, Exception):
+        logger.warning("Error getting task with ID: %s: %s", task_id, task_result)
+        return mutation_result, None
+    return mutation_result, task_result.content
+
+async def _collect_tasks(tasks_iterator, nmax, effective_limit):
+    """Flatten paginated task results, stopping at nmax or on a short page
+
+    Returns the tasks and the number of pages fetched.
+    """
+    all_tasks = []
+    pages_fetched = 0
+
+    async for task_batch in tasks_iterator:
+        pages_fetched += 1
+        if nmax is None:
+            all_tasks.extend(task_batch)
+        else:
+            # Take only what is still needed instead of trimming a copy afterwards
+            all_tasks.extend(islice(task_batch, nmax - len(all_tasks)))
+
+        logger.info("Fetched page %s with %s tasks (total: %s)", pages_fetched, len(task_batch), len(all_tasks))
+
+        if nmax is not None and len(all_tasks) >= nmax:
+            logger.info("Reached nmax of %s tasks, stopping pagination", nmax)
+            break
+
+        # Todoist API signals end of results by returning fewer items than requested
+        if len(task_batch) < effective_limit:
+            logger.info("Received %s tasks (less than limit %s), reached end of results", len(task_batch), effective_limit)
+            break
+
+    return all_tasks, pages_fetched
+
+async def _get_task_index(ctx: Context):
+    """Return all active tasks plus a lowercase-content lookup, cached alongside task lists
+
+    Returns a tuple (tasks, {lower_content: [task, ...]}) so name lookups lowercase each
+    task once per cache refresh instead of once per query.
+    """
+    todoist_client = ctx.request_context.lifespan_context.todoist_client
+    tasks_cache = ctx.request_context.lifespan_context.tasks_cache
+
+    async def fetch_index():
+        tasks_iterator = await todoist_client.get_tasks(limit=200)
+        all_tasks = []
+        async for task_batch in tasks_iterator:
+            all_tasks.extend(task_batch)
+
+        lower_map = {}
+        for task in all_tasks:
+            # Keep every task for duplicate titles so callers can refuse ambiguous names
+            lower_map.setdefault(task.content.lower(), []).append(task)
+
+        logger.info("Indexed %s active tasks by content", len(all_tasks))
+        return all_tasks, lower_map
+
+    return await tasks_cache.get_or_fetch("task_index", fetch_index)
+
+async def _resolve_task_by_name(ctx: Context, name: str) -> list:
+    """Find the active tasks whose title matches name exactly, ignoring case
+
+    Returns an empty list if no task matches, or several tasks if the name is ambiguous.
+    """
+    _, lower_map = await _get_task_index(ctx)
+    return lower_map.get(name.lower(), [])
+
+@tool_handler("creating task")
+async def todoist_add_task(
     ctx: Context,
     content: str,
     description: Optional[str] = None,
@@ -50,75 +222,167 @@ def todoist_add_task(
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Creating task: {content}")
-
-        task_params = {"content": content}
-
-        # Efficiently filter out None values to avoid sending unnecessary API parameters
-        optional_params = {
-            "description": description,
-            "project_id": project_id,
-            "section_id": section_id,
-            "parent_id": parent_id,
-            "order": order,
-            "labels": labels,
-            "assignee_id": assignee_id,
-            "due_string": due_string,
-            "due_lang": due_lang,
-            "deadline_lang": deadline_lang,
-        }
-
-        for key, value in optional_params.items():
-            if value is not None:
-                task_params[key] = value
-
-        # Transform string dates to objects since v3 API expects proper date/datetime types
-        if due_date is not None:
-            from datetime import date
-            if isinstance(due_date, str):
-                task_params["due_date"] = date.fromisoformat(due_date)
-            else:
-                task_params["due_date"] = due_date
-
-        if due_datetime is not None:
-            from datetime import datetime
-            if isinstance(due_datetime, str):
-                # Normalize RFC3339 format to Python's expected format
-                if due_datetime.endswith('Z'):
-                    due_datetime = due_datetime[:-1] + '+00:00'
-                task_params["due_datetime"] = datetime.fromisoformat(due_datetime)
-            else:
-                task_params["due_datetime"] = due_datetime
-
-        if deadline_date is not None:
-            from datetime import date
-            if isinstance(deadline_date, str):
-                task_params["deadline_date"] = date.fromisoformat(deadline_date)
-            else:
-                task_params["deadline_date"] = deadline_date
-
-        # Validate priority bounds to prevent API errors
-        if priority is not None and 1 <= priority <= 4:
-            task_params["priority"] = priority
-
-        # Duration requires both values to be meaningful - enforce this constraint
-        if duration is not None and duration_unit is not None:
-            if duration > 0 and duration_unit in ["minute", "day"]:
-                task_params["duration"] = duration
-                task_params["duration_unit"] = duration_unit
-            else:
-                logger.warning("Invalid duration parameters: duration must be > 0 and unit must be 'minute' or 'day'")
-
-        task = todoist_client.add_task(**task_params)
-
-        logger.info(f"Task created successfully: {task.id}")
-        return json.dumps(task.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error creating task: {error}")
-        return f"Error creating task: {str(error)}"
-
-def todoist_get_tasks(
+    logger.info("Creating task: %s", content)
+
+    task_params = {"content": content}
+
+    # Efficiently filter out None values to avoid sending unnecessary API parameters
+    optional_params = {
+        "description": description,
+        "project_id": project_id,
+        "section_id": section_id,
+        "parent_id": parent_id,
+        "order": order,
+        "labels": labels,
+        "assignee_id": assignee_id,
+        "due_string": due_string,
+        "due_lang": due_lang,
+        "deadline_lang": deadline_lang,
+    }
+
+    task_params.update({key: value for key, value in optional_params.items() if value is not None})
+
+    # Transform string dates to objects since v3 API expects proper date/datetime types
+    if due_date is not None:
+        task_params["due_date"] = _coerce_date(due_date)
+
+    if due_datetime is not None:
+        task_params["due_datetime"] = _coerce_datetime(due_datetime)
+
+    if deadline_date is not None:
+        task_params["deadline_date"] = _coerce_date(deadline_date)
+
+    # Validate priority bounds to prevent API errors
+    if priority in _VALID_PRIORITIES:
+        task_params["priority"] = priority
+
+    # Duration requires both values to be meaningful - enforce this constraint
+    if duration is not None and duration_unit is not None:
+        if duration > 0 and duration_unit in _DURATION_UNITS:
+            task_params["duration"] = duration
+            task_params["duration_unit"] = duration_unit
+        else:
+            logger.warning("Invalid duration parameters: duration must be > 0 and unit must be 'minute' or 'day'")
+
+    task = await todoist_client.add_task(**task_params)
+    _invalidate_task_caches(ctx)
+    ctx.request_context.lifespan_context.task_lookup_cache.set(task.id, task)
+
+    logger.info("Task created successfully: %s", task.id)
+    return dumps(task)
+
+def _item_add_args(spec: dict, temp_ids: list) -> dict:
+    """Translate one todoist_add_tasks entry into Sync API item_add arguments
+
+    Raises ValueError for entries the API would reject, so they fail without a request.
+    """
+    content = spec.get("content")
+    if not content:
+        raise ValueError("content is required")
+    args = {"content": content}
+
+    # Fields whose Sync API name matches the REST parameter name
+    for key in ("description", "project_id", "section_id", "parent_id", "labels"):
+        if spec.get(key) is not None:
+            args[key] = spec[key]
+    if spec.get("order") is not None:
+        args["child_order"] = spec["order"]
+    if spec.get("assignee_id") is not None:
+        args["responsible_uid"] = spec["assignee_id"]
+    if spec.get("priority") in _VALID_PRIORITIES:
+        args["priority"] = spec["priority"]
+
+    parent_index = spec.get("parent_index")
+    if parent_index is not None:
+        if not isinstance(parent_index, int) or not 0 <= parent_index < len(temp_ids):
+            raise ValueError(f"parent_index {parent_index} must refer to an earlier task in the list")
+        if temp_ids[parent_index] is None:
+            raise ValueError(f"parent task at index {parent_index} was not created")
+        # The Sync API resolves a temp ID used as parent_id within the same request
+        args["parent_id"] = temp_ids[parent_index]
+
+    # Validate and format dates the same way add_task does, but send them as strings
+    due = {}
+    if spec.get("due_string") is not None:
+        due["string"] = spec["due_string"]
+    if spec.get("due_date") is not None:
+        due["date"] = _coerce_date(spec["due_date"]).isoformat()
+    if spec.get("due_datetime") is not None:
+        # Format as the SDK does for todoist_add_task: offsets are converted to UTC "Z"
+        due["date"] = format_datetime(_coerce_datetime(spec["due_datetime"]))
+    if due:
+        if spec.get("due_lang") is not None:
+            due["lang"] = spec["due_lang"]
+        args["due"] = due
+    if spec.get("deadline_date") is not None:
+        deadline = {"date": _coerce_date(spec["deadline_date"]).isoformat()}
+        if spec.get("deadline_lang") is not None:
+            deadline["lang"] = spec["deadline_lang"]
+        args["deadline"] = deadline
+
+    duration, duration_unit = spec.get("duration"), spec.get("duration_unit")
+    if duration is not None and duration_unit is not None:
+        # JSON clients may send the amount as a string; anything else fails just this entry
+        try:
+            duration = int(duration)
+        except (TypeError, ValueError):
+            raise ValueError(f"duration must be a positive integer, got {duration!r}") from None
+        if duration > 0 and duration_unit in _DURATION_UNITS:
+            args["duration"] = {"amount": duration, "unit": duration_unit}
+        else:
+            logger.warning("Invalid duration parameters: duration must be > 0 and unit must be 'minute' or 'day'")
+    return args
+
+@tool_handler("creating tasks")
+async def todoist_add_tasks(ctx: Context, tasks: list[dict]) -> str:
+    """Create several tasks in Todoist with a single request
+
+    Each entry takes the same fields as todoist_add_task (content is required). To create
+    subtasks of a task in the same call, set "parent_index" to the position of the parent
+    entry in the list; the parent must come first.
+
+    Args:
+        tasks: Task definitions, at most 100 per call
+    """
+    sync_batcher = ctx.request_context.lifespan_context.sync_batcher
+
+    if len(tasks) > MAX_COMMANDS:
+        return f"Error: At most {MAX_COMMANDS} tasks can be created in one call"
+
+    logger.info("Creating %s tasks", len(tasks))
+
+    # Entries that fail validation get no command; their position keeps None as temp ID
+    commands = []
+    temp_ids = []
+    errors = {}
+    for index, spec in enumerate(tasks):
+        try:
+            args = _item_add_args(spec, temp_ids)
+        except ValueError as error:
+            errors[index] = error
+            temp_ids.append(None)
+            continue
+        temp_id = uuid.uuid4().hex
+        temp_ids.append(temp_id)
+        commands.append(("item_add", args, temp_id))
+
+    outcomes = iter(await sync_batcher.submit_many(commands)) if commands else iter(())
+    _invalidate_task_caches(ctx)
+
+    lines = []
+    for index, spec in enumerate(tasks):
+        content = spec.get("content")
+        outcome = errors[index] if index in errors else next(outcomes)
+        if isinstance(outcome, Exception):
+            lines.append(f"Error creating task: {content}: {outcome}")
+        else:
+            lines.append(f"Successfully created task: {content} (ID: {outcome})")
+
+    logger.info("Processed %s task creations", len(tasks))
+    return "\n".join(lines)
+
+@tool_handler("getting tasks")
+async def todoist_get_tasks(
     ctx: Context,
     project_id: Optional[str] = None,
     section_id: Optional[str] = None,
@@ -163,86 +427,78 @@ def todoist_get_tasks(
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Getting tasks with project_id: {project_id}, section_id: {section_id}, parent_id: {parent_id}, label: {label}, nmax: {nmax}, limit: {limit}")
-
-        # Early exit for zero requests to avoid unnecessary API calls
-        if nmax is not None:
-            if nmax == 0:
-                logger.info("nmax=0 specified, returning empty result")
-                return []
-            elif nmax < 0:
-                logger.warning(f"Invalid nmax {nmax}, using default of 100")
-                nmax = 100
-
-        if limit > 200:
-            logger.warning(f"Limit {limit} exceeds API maximum of 200, using 200 instead")
-            limit = 200
-        elif limit <= 0:
-            logger.warning(f"Invalid limit {limit}, using default of 200")
-            limit = 200
-
-        # Key optimization: match page size to actual need to reduce API payload
-        effective_limit = limit
-        if nmax is not None and nmax < limit:
-            effective_limit = nmax
-            logger.info(f"Optimized limit from {limit} to {effective_limit} to match nmax")
-
-        params = {}
-        if project_id:
-            params["project_id"] = project_id
-        if section_id:
-            params["section_id"] = section_id
-        if parent_id:
-            params["parent_id"] = parent_id
-        if label:
-            params["label"] = label
-        if ids:
-            params["ids"] = ids
-        params["limit"] = effective_limit
-
-        tasks_iterator = todoist_client.get_tasks(**params)
-        all_tasks = []
-        pages_fetched = 0
-
-        for task_batch in tasks_iterator:
-            pages_fetched += 1
-            all_tasks.extend(task_batch)
-
-            logger.info(f"Fetched page {pages_fetched} with {len(task_batch)} tasks (total: {len(all_tasks)})")
+    logger.info("Getting tasks with project_id: %s, section_id: %s, parent_id: %s, label: %s, nmax: %s, limit: %s", project_id, section_id, parent_id, label, nmax, limit)
 
-            if nmax is not None and len(all_tasks) >= nmax:
-                # Trim excess - rare due to effective_limit optimization, but handles edge cases
-                all_tasks = all_tasks[:nmax]
-                logger.info(f"Reached nmax of {nmax} tasks, stopping pagination")
-                break
+    # Early exit for zero requests to avoid unnecessary API calls
+    if nmax is not None:
+        if nmax == 0:
+            logger.info("nmax=0 specified, returning empty result")
+            return "[]"
+        elif nmax < 0:
+            logger.warning("Invalid nmax %s, using default of 100", nmax)
+            nmax = 100
 
-            # Todoist API signals end of results by returning fewer items than requested
-            if len(task_batch) < effective_limit:
-                logger.info(f"Received {len(task_batch)} tasks (less than limit {effective_limit}), reached end of results")
-                break
-
-        if not all_tasks:
+    # A lookup of one ID with no other filters is a plain single-task GET, no paginator needed
+    if ids and len(ids) == 1 and not (project_id or section_id or parent_id or label):
+        try:
+            task = await _get_task_cached(ctx, ids[0])
+        except requests.HTTPError as error:
+            if error.response is None or error.response.status_code != 404:
+                raise
+            task = None
+        # get_tasks only lists active tasks, so an unknown or completed task is simply no match
+        if task is None or task.completed_at is not None:
             logger.info("No tasks found matching the criteria")
             return "No tasks found matching the criteria"
-
-        logger.info(f"Retrieved {len(all_tasks)} tasks total across {pages_fetched} pages")
-
-        if nmax is None:
-            logger.info("Fetched ALL matching tasks (nmax=None specified)")
-        elif len(all_tasks) == nmax:
-            logger.info(f"Retrieved exactly the requested {nmax} tasks")
-
-        return json.dumps([task.to_dict() for task in all_tasks], indent=2, default=str)
-
-    except Exception as error:
-        logger.error(f"Error getting tasks: {error}")
-        return f"Error getting tasks: {str(error)}"
-
-def todoist_filter_tasks(
+        return dumps([task])
+
+    limit = clamp_limit(limit)
+
+    # Key optimization: match page size to actual need to reduce API payload
+    effective_limit = limit
+    if nmax is not None and nmax < limit:
+        effective_limit = nmax
+        logger.info("Optimized limit from %s to %s to match nmax", limit, effective_limit)
+
+    # Falsy filters (None, empty strings or lists) are left out of the request
+    filters = {
+        "project_id": project_id,
+        "section_id": section_id,
+        "parent_id": parent_id,
+        "label": label,
+        "ids": ids,
+    }
+    params = {key: value for key, value in filters.items() if value}
+    params["limit"] = effective_limit
+
+    async def fetch_tasks():
+        tasks_iterator = await todoist_client.get_tasks(**params)
+        all_tasks, pages_fetched = await _collect_tasks(tasks_iterator, nmax, effective_limit)
+
+        logger.info("Retrieved %s tasks total across %s pages", len(all_tasks), pages_fetched)
+        return all_tasks
+
+    # Cache key covers every argument that shapes the result; ids is a list so freeze it
+    cache_key = ("get_tasks", project_id, section_id, parent_id, label, tuple(ids) if ids else None, nmax, effective_limit)
+    all_tasks = await _get_tasks_cached(ctx, cache_key, fetch_tasks)
+
+    if not all_tasks:
+        logger.info("No tasks found matching the criteria")
+        return "No tasks found matching the criteria"
+
+    if nmax is None:
+        logger.info("Fetched ALL matching tasks (nmax=None specified)")
+    elif len(all_tasks) == nmax:
+        logger.info("Retrieved exactly the requested %s tasks", nmax)
+
+    return dumps(all_tasks)
+
+@tool_handler("filtering tasks")
+async def todoist_filter_tasks(
     ctx: Context,
     filter: str,
     lang: Optional[str] = None,
+    priority: Optional[int] = None,
     nmax: Optional[int] = 100,
     limit: int = 200
 ) -> str:
@@ -253,80 +509,67 @@ def todoist_filter_tasks(
     Args:
         filter: Natural language filter like 'today', 'tomorrow', 'next week', 'priority 1', 'overdue'
         lang: Language for task content (e.g., 'en') (optional)
+        priority: Only return tasks with this priority, from 1 (normal) to 4 (urgent) (optional)
         nmax: Maximum total number of tasks to return. Set to None for ALL matching tasks (default: 100)
         limit: Number of tasks to fetch per API request (default: 200, max: 200)
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Filtering tasks with filter: '{filter}', lang: {lang}, nmax: {nmax}, limit: {limit}")
-
-        # Early exit for zero requests to avoid unnecessary API calls
-        if nmax is not None:
-            if nmax == 0:
-                logger.info("nmax=0 specified, returning empty result")
-                return []
-            elif nmax < 0:
-                logger.warning(f"Invalid nmax {nmax}, using default of 100")
-                nmax = 100
-
-        if limit > 200:
-            logger.warning(f"Limit {limit} exceeds API maximum of 200, using 200 instead")
-            limit = 200
-        elif limit <= 0:
-            logger.warning(f"Invalid limit {limit}, using default of 200")
-            limit = 200
-
-        # Key optimization: match page size to actual need to reduce API payload
-        effective_limit = limit
-        if nmax is not None and nmax < limit:
-            effective_limit = nmax
-            logger.info(f"Optimized limit from {limit} to {effective_limit} to match nmax")
-
-        params = {"query": filter}
-        if lang:
-            params["lang"] = lang
-        params["limit"] = effective_limit
-
-        tasks_iterator = todoist_client.filter_tasks(**params)
-        all_tasks = []
-        pages_fetched = 0
-
-        for task_batch in tasks_iterator:
-            pages_fetched += 1
-            all_tasks.extend(task_batch)
-
-            logger.info(f"Fetched page {pages_fetched} with {len(task_batch)} tasks (total: {len(all_tasks)})")
-
-            if nmax is not None and len(all_tasks) >= nmax:
-                # Trim excess - rare due to effective_limit optimization, but handles edge cases
-                all_tasks = all_tasks[:nmax]
-                logger.info(f"Reached nmax of {nmax} tasks, stopping pagination")
-                break
-
-            # Todoist API signals end of results by returning fewer items than requested
-            if len(task_batch) < effective_limit:
-                logger.info(f"Received {len(task_batch)} tasks (less than limit {effective_limit}), reached end of results")
-                break
-
-        if not all_tasks:
-            logger.info("No tasks found matching the filter")
-            return "No tasks found matching the filter"
-
-        logger.info(f"Retrieved {len(all_tasks)} tasks total across {pages_fetched} pages")
-
-        if nmax is None:
-            logger.info("Fetched ALL matching tasks (nmax=None specified)")
-        elif len(all_tasks) == nmax:
-            logger.info(f"Retrieved exactly the requested {nmax} tasks")
-
-        return json.dumps([task.to_dict() for task in all_tasks], indent=2, default=str)
-
-    except Exception as error:
-        logger.error(f"Error filtering tasks: {error}")
-        return f"Error filtering tasks: {str(error)}"
-
-def todoist_get_task(ctx: Context, task_id: str) -> str:
+    logger.info("Filtering tasks with filter: '%s', lang: %s, priority: %s, nmax: %s, limit: %s", filter, lang, priority, nmax, limit)
+
+    # Early exit for zero requests to avoid unnecessary API calls
+    if nmax is not None:
+        if nmax == 0:
+            logger.info("nmax=0 specified, returning empty result")
+            return "[]"
+        elif nmax < 0:
+            logger.warning("Invalid nmax %s, using default of 100", nmax)
+            nmax = 100
+
+    limit = clamp_limit(limit)
+
+    # Key optimization: match page size to actual need to reduce API payload
+    effective_limit = limit
+    if nmax is not None and nmax < limit:
+        effective_limit = nmax
+        logger.info("Optimized limit from %s to %s to match nmax", limit, effective_limit)
+
+    # Push the priority filter to the API so non-matching tasks are never transferred.
+    # Filter syntax inverts the API scale: API priority 4 (urgent) is p1 in a query.
+    query = filter
+    if priority in _VALID_PRIORITIES:
+        query = f"({filter}) & p{5 - priority}"
+
+    params = {"query": query}
+    if lang:
+        params["lang"] = lang
+    params["limit"] = effective_limit
+
+    async def fetch_tasks():
+        tasks_iterator = await todoist_client.filter_tasks(**params)
+        all_tasks, pages_fetched = await _collect_tasks(tasks_iterator, nmax, effective_limit)
+
+        logger.info("Retrieved %s tasks total across %s pages", len(all_tasks), pages_fetched)
+        return all_tasks
+
+    # Same short-lived cache as todoist_get_tasks; relative filters like 'today' can only
+    # drift by the cache TTL, and task mutations clear it
+    cache_key = ("filter_tasks", query, lang, nmax, effective_limit)
+    all_tasks = await _get_tasks_cached(ctx, cache_key, fetch_tasks)
+
+    if not all_tasks:
+        logger.info("No tasks found matching the filter")
+        return "No tasks found matching the filter"
+
+    if nmax is None:
+        logger.info("Fetched ALL matching tasks (nmax=None specified)")
+    elif len(all_tasks) == nmax:
+        logger.info("Retrieved exactly the requested %s tasks", nmax)
+
+    return dumps(all_tasks)
+
+@tool_handler("getting task")
+async def todoist_get_task(ctx: Context, task_id: str) -> str:
     """Get an active task from Todoist
 
     Args:
@@ -334,22 +577,20 @@ def todoist_get_task(ctx: Context, task_id: str) -> str:
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Getting task with ID: {task_id}")
+    logger.info("Getting task with ID: %s", task_id)
 
-        task = todoist_client.get_task(task_id=task_id)
+    task = await todoist_client.get_task(task_id=task_id)
 
-        if not task:
-            logger.info(f"No task found with ID: {task_id}")
-            return f"No task found with ID: {task_id}"
+    if not task:
+        logger.info("No task found with ID: %s", task_id)
+        return f"No task found with ID: {task_id}"
 
-        logger.info(f"Retrieved task: {task.id}")
-        return json.dumps(task.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error getting task: {error}")
-        return f"Error getting task: {str(error)}"
+    ctx.request_context.lifespan_context.task_lookup_cache.set(task.id, task)
+    logger.info("Retrieved task: %s", task.id)
+    return dumps(task)
 
-def todoist_update_task(
+@tool_handler("updating task")
+async def todoist_update_task(
     ctx: Context,
     task_id: str,
     content: Optional[str] = None,
@@ -386,138 +627,123 @@ def todoist_update_task(
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Updating task with ID: {task_id}")
+    logger.info("Updating task with ID: %s", task_id)
 
-        # Verify task exists before attempting update to provide better error messages
-        try:
-            task = todoist_client.get_task(task_id=task_id)
-            original_content = task.content
-        except Exception as error:
-            logger.warning(f"Error getting task with ID: {task_id}: {error}")
+    # Apply same parameter filtering strategy as create
+    optional_params = {
+        "content": content,
+        "description": description,
+        "labels": labels,
+        "due_string": due_string,
+        "due_lang": due_lang,
+        "assignee_id": assignee_id,
+        "deadline_lang": deadline_lang,
+    }
+
+    update_data = {key: value for key, value in optional_params.items() if value is not None}
+
+    # Apply same date transformation logic as create for consistency
+    if due_date is not None:
+        update_data["due_date"] = _coerce_date(due_date)
+
+    if due_datetime is not None:
+        update_data["due_datetime"] = _coerce_datetime(due_datetime)
+
+    if deadline_date is not None:
+        update_data["deadline_date"] = _coerce_date(deadline_date)
+
+    if priority in _VALID_PRIORITIES:
+        update_data["priority"] = priority
+
+    if duration is not None and duration_unit is not None:
+        if duration > 0 and duration_unit in _DURATION_UNITS:
+            update_data["duration"] = duration
+            update_data["duration_unit"] = duration_unit
+        else:
+            logger.warning("Invalid duration parameters: duration must be > 0 and unit must be 'minute' or 'day'")
+
+    if len(update_data) == 0:
+        # Name the task only if it is already cached; this message isn't worth a request
+        task = ctx.request_context.lifespan_context.task_lookup_cache.get(task_id)
+        return f"No update parameters provided for {_task_label(task and task.content, task_id)}"
+
+    # No pre-fetch: the update itself rejects unknown IDs and returns the task with its content
+    try:
+        updated_task = await todoist_client.update_task(task_id, **update_data)
+    except requests.HTTPError as error:
+        if error.response is not None and error.response.status_code == 404:
+            logger.warning("No task found with ID: %s", task_id)
             return f"Could not verify task with ID: {task_id}. Update aborted."
+        raise
+    _invalidate_task_caches(ctx)
+    ctx.request_context.lifespan_context.task_lookup_cache.set(task_id, updated_task)
+
+    logger.info("Task updated successfully: %s", task_id)
+    return dumps(updated_task)
 
-        update_data = {}
-
-        # Apply same parameter filtering strategy as create
-        optional_params = {
-            "content": content,
-            "description": description,
-            "labels": labels,
-            "due_string": due_string,
-            "due_lang": due_lang,
-            "assignee_id": assignee_id,
-            "deadline_lang": deadline_lang,
-        }
-
-        for key, value in optional_params.items():
-            if value is not None:
-                update_data[key] = value
-
-        # Apply same date transformation logic as create for consistency
-        if due_date is not None:
-            from datetime import date
-            if isinstance(due_date, str):
-                update_data["due_date"] = date.fromisoformat(due_date)
-            else:
-                update_data["due_date"] = due_date
-
-        if due_datetime is not None:
-            from datetime import datetime
-            if isinstance(due_datetime, str):
-                if due_datetime.endswith('Z'):
-                    due_datetime = due_datetime[:-1] + '+00:00'
-                update_data["due_datetime"] = datetime.fromisoformat(due_datetime)
-            else:
-                update_data["due_datetime"] = due_datetime
-
-        if deadline_date is not None:
-            from datetime import date
-            if isinstance(deadline_date, str):
-                update_data["deadline_date"] = date.fromisoformat(deadline_date)
-            else:
-                update_data["deadline_date"] = deadline_date
-
-        if priority is not None and 1 <= priority <= 4:
-            update_data["priority"] = priority
-
-        if duration is not None and duration_unit is not None:
-            if duration > 0 and duration_unit in ["minute", "day"]:
-                update_data["duration"] = duration
-                update_data["duration_unit"] = duration_unit
-            else:
-                logger.warning("Invalid duration parameters: duration must be > 0 and unit must be 'minute' or 'day'")
-
-        if len(update_data) == 0:
-            return f"No update parameters provided for task: {original_content} (ID: {task_id})"
-
-        updated_task = todoist_client.update_task(task_id, **update_data)
-
-        logger.info(f"Task updated successfully: {task_id}")
-        return json.dumps(updated_task.to_dict(), indent=2, default=str)
-    except Exception as error:
-        logger.error(f"Error updating task: {error}")
-        return f"Error updating task: {str(error)}"
-
-def todoist_complete_task(ctx: Context, task_id: str) -> str:
+@tool_handler("closing task")
+async def todoist_complete_task(ctx: Context, task_id: str, verify: bool = True) -> str:
     """Close a task in Todoist (i.e., mark the task as complete)
 
     Args:
         task_id: ID of the task to close
+        verify: Fetch the task first to check it exists and name it in the result. With False, the close runs without the check and the name is looked up alongside it (default: True)
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Closing task with ID: {task_id}")
+    logger.info("Closing task with ID: %s", task_id)
 
-        # Pre-fetch task content for meaningful success messages
+    # Pre-fetch task content for meaningful success messages
+    if verify:
         try:
-            task = todoist_client.get_task(task_id=task_id)
+            task = await _get_task_cached(ctx, task_id)
             task_content = task.content
         except Exception as error:
-            logger.warning(f"Error getting task with ID: {task_id}: {error}")
+            logger.warning("Error getting task with ID: %s: %s", task_id, error)
             return f"Could not verify task with ID: {task_id}. Task closing aborted."
+        is_success = await todoist_client.complete_task(task_id=task_id)
+    else:
+        is_success, task_content = await _run_with_task_content(ctx, task_id, todoist_client.complete_task(task_id=task_id))
+    _invalidate_task_caches(ctx, task_id, subtasks=True)
 
-        is_success = todoist_client.complete_task(task_id=task_id)
-
-        logger.info(f"Task closed successfully: {task_id}")
-        return f"Successfully closed task: {task_content} (ID: {task_id})"
-    except Exception as error:
-        logger.error(f"Error closing task: {error}")
-        return f"Error closing task: {str(error)}"
+    logger.info("Task closed successfully: %s", task_id)
+    return f"Successfully closed {_task_label(task_content, task_id)}"
 
-def todoist_uncomplete_task(ctx: Context, task_id: str) -> str:
+@tool_handler("reopening task")
+async def todoist_uncomplete_task(ctx: Context, task_id: str, verify: bool = True) -> str:
     """Reopen a task in Todoist (i.e., mark the task as incomplete)
 
     Args:
         task_id: ID of the task to reopen
+        verify: Fetch the task first to check it exists and name it in the result. With False, the reopen runs without the check and the name is looked up alongside it (default: True)
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Reopening task with ID: {task_id}")
+    logger.info("Reopening task with ID: %s", task_id)
 
+    if verify:
         try:
-            task = todoist_client.get_task(task_id=task_id)
+            task = await _get_task_cached(ctx, task_id)
             task_content = task.content
         except Exception as error:
-            logger.warning(f"Error getting task with ID: {task_id}: {error}")
+            logger.warning("Error getting task with ID: %s: %s", task_id, error)
             return f"Could not verify task with ID: {task_id}. Task reopening aborted."
+        is_success = await todoist_client.uncomplete_task(task_id=task_id)
+    else:
+        is_success, task_content = await _run_with_task_content(ctx, task_id, todoist_client.uncomplete_task(task_id=task_id))
+    _invalidate_task_caches(ctx, task_id)
 
-        is_success = todoist_client.uncomplete_task(task_id=task_id)
-
-        logger.info(f"Task reopened successfully: {task_id}")
-        return f"Successfully reopened task: {task_content} (ID: {task_id})"
-    except Exception as error:
-        logger.error(f"Error reopening task: {error}")
-        return f"Error reopening task: {str(error)}"
+    logger.info("Task reopened successfully: %s", task_id)
+    return f"Successfully reopened {_task_label(task_content, task_id)}"
 
-def todoist_move_task(
+@tool_handler("moving task")
+async def todoist_move_task(
     ctx: Context,
     task_id: str,
     parent_id: Optional[str] = None,
     section_id: Optional[str] = None,
-    project_id: Optional[str] = None
+    project_id: Optional[str] = None,
+    verify: bool = True
 ) -> str:
     """Move a task to a different location
 
@@ -526,68 +752,170 @@ def todoist_move_task(
         parent_id: ID of the destination parent task (optional)
         section_id: ID of the destination section (optional)
         project_id: ID of the destination project (optional)
+        verify: Fetch the task first to check it exists and name it in the result. With False, the move runs without the check and the name is looked up alongside it (default: True)
 
     Note: Only one of parent_id, section_id or project_id must be set.
     """
-    todoist_client = ctx.request_context.lifespan_context.todoist_client
+    sync_batcher = ctx.request_context.lifespan_context.sync_batcher
 
-    try:
-        logger.info(f"Moving task with ID: {task_id}")
+    logger.info("Moving task with ID: %s", task_id)
+
+    # Validate exclusive destination constraint - API requirement; checked before any request
+    destinations = {key: value for key, value in zip(_MOVE_DESTINATIONS, (parent_id, section_id, project_id)) if value is not None}
+
+    if len(destinations) != 1:
+        return "Error: Exactly one of parent_id, section_id, or project_id must be specified"
+
+    # Moves go through the Sync API batcher so a burst of single moves shares one request;
+    # a rejected command raises SyncCommandError with the API's reason
+    move = partial(sync_batcher.submit, "item_move", {"id": task_id, **destinations})
 
+    if verify:
         try:
-            task = todoist_client.get_task(task_id=task_id)
+            task = await _get_task_cached(ctx, task_id)
             task_content = task.content
         except Exception as error:
-            logger.warning(f"Error getting task with ID: {task_id}: {error}")
+            logger.warning("Error getting task with ID: %s: %s", task_id, error)
             return f"Could not verify task with ID: {task_id}. Task move aborted."
+        await move()
+    else:
+        _, task_content = await _run_with_task_content(ctx, task_id, move())
 
-        # Validate exclusive destination constraint - API requirement
-        destination_count = sum(1 for x in [parent_id, section_id, project_id] if x is not None)
+    _invalidate_task_caches(ctx, task_id, subtasks=True)
+    logger.info("Task moved successfully: %s", task_id)
+    return f"Successfully moved {_task_label(task_content, task_id)}"
 
-        if destination_count != 1:
-            return "Error: Exactly one of parent_id, section_id, or project_id must be specified"
+@tool_handler("moving tasks")
+async def todoist_move_tasks(ctx: Context, moves: list[dict]) -> str:
+    """Move several tasks in one request
 
-        is_success = todoist_client.move_task(
-            task_id=task_id,
-            parent_id=parent_id,
-            section_id=section_id,
-            project_id=project_id
-        )
+    Each move is {"task_id": ..., plus exactly one of "parent_id", "section_id" or "project_id"}.
+    The moves are sent together as Sync API item_move commands instead of one request each.
 
-        if is_success:
-            logger.info(f"Task moved successfully: {task_id}")
-            return f"Successfully moved task: {task_content} (ID: {task_id})"
+    Args:
+        moves: The moves to make
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+
+    logger.info("Moving %s tasks", len(moves))
+
+    async def move(spec):
+        if not spec.get("task_id"):
+            raise ValueError("task_id is required")
+        destinations = {key: spec[key] for key in _MOVE_DESTINATIONS if spec.get(key) is not None}
+        if len(destinations) != 1:
+            raise ValueError("Exactly one of parent_id, section_id, or project_id must be specified")
+        return await lifespan_context.sync_batcher.submit("item_move", {"id": spec["task_id"], **destinations})
+
+    task_ids = [spec.get("task_id") for spec in moves]
+    # Label results with names that are already cached; moving doesn't change a task's content
+    labels = []
+    for task_id in task_ids:
+        task = lifespan_context.task_lookup_cache.get(task_id) if task_id else None
+        labels.append(_task_label(task and task.content, task_id))
+
+    # Submitted together, so the batcher sends them in as few requests as its 100-command cap allows
+    results = await asyncio.gather(*(move(spec) for spec in moves), return_exceptions=True)
+    _invalidate_task_caches(ctx, *(task_id for task_id in task_ids if task_id), subtasks=True)
+
+    lines = []
+    for label, result in zip(labels, results):
+        if isinstance(result, Exception):
+            lines.append(f"Error moving {label}: {result}")
         else:
-            error_msg = "Failed to move task"
-            logger.error(error_msg)
-            return error_msg
+            lines.append(f"Successfully moved {label}")
 
-    except Exception as error:
-        logger.error(f"Error moving task: {error}")
-        return f"Error moving task: {str(error)}"
+    logger.info("Processed %s task moves", len(moves))
+    return "\n".join(lines)
 
-def todoist_delete_task(ctx: Context, task_id: str) -> str:
+@tool_handler("deleting task")
+async def todoist_delete_task(ctx: Context, task_id: str, verify: bool = True) -> str:
     """Delete a task from Todoist
 
     Args:
         task_id: ID of the task to delete
+        verify: Fetch the task first to check it exists and name it in the result. With False, the delete runs without the check and the name is looked up alongside it (default: True)
     """
     todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-    try:
-        logger.info(f"Deleting task with ID: {task_id}")
+    logger.info("Deleting task with ID: %s", task_id)
 
+    if verify:
         try:
-            task = todoist_client.get_task(task_id=task_id)
+            task = await _get_task_cached(ctx, task_id)
             task_content = task.content
         except Exception as error:
-            logger.warning(f"Error getting task with ID: {task_id}: {error}")
+            logger.warning("Error getting task with ID: %s: %s", task_id, error)
             return f"Could not verify task with ID: {task_id}. Deletion aborted."
+        is_success = await todoist_client.delete_task(task_id=task_id)
+    else:
+        is_success, task_content = await _run_with_task_content(ctx, task_id, todoist_client.delete_task(task_id=task_id))
+    _invalidate_task_caches(ctx, task_id, subtasks=True)
+
+    logger.info("Task deleted successfully: %s", task_id)
+    return f"Successfully deleted {_task_label(task_content, task_id)}"
 
-        is_success = todoist_client.delete_task(task_id=task_id)
+async def _apply_to_tasks_by_name(ctx: Context, names: list[str], action, gerund: str, past: str) -> str:
+    """Resolve each name to an active task, then run action(task_id) for all of them concurrently
+
+    Returns one report line per name. Names resolving to the same task run the action once.
+    """
+    # One task list fetch and index build serves every name in the batch
+    resolved = [(name, await _resolve_task_by_name(ctx, name)) for name in names]
+    # Only act on names that match exactly one task; the rest are reported as errors
+    task_ids = list(dict.fromkeys(matches[0].id for _, matches in resolved if len(matches) == 1))
+
+    results = await bounded_gather([action(task_id=task_id) for task_id in task_ids], limit=5)
+    if task_ids:
+        _invalidate_task_caches(ctx, *task_ids, subtasks=True)
+
+    outcomes = dict(zip(task_ids, results))
+    lines = []
+    for name, matches in resolved:
+        if not matches:
+            lines.append(f"No task found matching: {name}")
+            continue
+        if len(matches) > 1:
+            task_ids_text = ", ".join(task.id for task in matches)
+            lines.append(f"Multiple tasks match: {name} (IDs: {task_ids_text}); use the task ID instead")
+            continue
+        task = matches[0]
+        if isinstance(outcomes[task.id], Exception):
+            lines.append(f"Error {gerund} task: {task.content} (ID: {task.id}): {outcomes[task.id]}")
+        else:
+            lines.append(f"Successfully {past} task: {task.content} (ID: {task.id})")
+    return "\n".join(lines)
+
+@tool_handler("deleting tasks")
+async def todoist_delete_tasks(ctx: Context, names: list[str]) -> str:
+    """Delete several tasks from Todoist, looking each one up by name
+
+    Each name must match exactly one active task title (case-insensitive). Names that
+    match no task or several tasks are reported as errors and nothing is deleted for them.
+
+    Args:
+        names: Names (titles) of the tasks to delete
+    """
+    todoist_client = ctx.request_context.lifespan_context.todoist_client
+
+    logger.info("Deleting %s tasks by name", len(names))
+    result = await _apply_to_tasks_by_name(ctx, names, todoist_client.delete_task, "deleting", "deleted")
+    logger.info("Processed %s task deletions", len(names))
+    return result
+
+@tool_handler("closing tasks")
+async def todoist_bulk_close_tasks(ctx: Context, names: list[str]) -> str:
+    """Close several tasks in Todoist (i.e., mark them as complete), looking each one up by name
+
+    Each name must match exactly one active task title (case-insensitive). Names that
+    match no task or several tasks are reported as errors and nothing is closed for them.
+
+    Args:
+        names: Names (titles) of the tasks to close
+    """
+    todoist_client = ctx.request_context.lifespan_context.todoist_client
 
-        logger.info(f"Task deleted successfully: {task_id}")
-        return f"Successfully deleted task: {task_content} (ID: {task_id})"
-    except Exception as error:
-        logger.error(f"Error deleting task: {error}")
-        return f"Error deleting task: {str(error)}"
+    logger.info("Closing %s tasks by name", len(names))
+    result = await _apply_to_tasks_by_name(ctx, names, todoist_client.complete_task, "closing", "closed")
+    logger.info("Processed %s task closings", len(names))
+    return result
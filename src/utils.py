@@ -1,7 +1,258 @@
 #!/usr/bin/env python3
 
+import asyncio
+import functools
+import json
 import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder if the C extension is unavailable
+    orjson = None
 
 logger = logging.getLogger("todoist-mcp-server")
 
-# Add any utility functions here if needed
+_MISSING = object()
+
+# Pretty-printed responses are opt-in for humans reading raw tool output
+_INDENT_JSON = os.getenv("TODOIST_MCP_INDENT_JSON", "").lower() in ("1", "true", "yes")
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | (orjson.OPT_INDENT_2 if _INDENT_JSON else 0)
+
+def _default(obj: Any) -> Any:
+    # SDK models expose to_dict(); anything else unknown (e.g. datetimes for json) becomes a string
+    to_dict = getattr(obj, "to_dict", None)
+    return to_dict() if to_dict is not None else str(obj)
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool response to a JSON string, using orjson when it is installed
+
+    Output is compact unless TODOIST_MCP_INDENT_JSON is set, since indentation only adds
+    bytes for the model reading it. SDK models can be passed as-is: orjson encodes
+    dataclasses and datetimes natively in one pass, skipping the SDK's reflection-based
+    to_dict(). The stdlib fallback converts them through to_dict() instead.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode()
+    if _INDENT_JSON:
+        return json.dumps(obj, indent=2, default=_default)
+    return json.dumps(obj, separators=(",", ":"), default=_default)
+
+def tool_handler(action: str):
+    """Decorate a tool coroutine with latency logging and uniform error reporting
+
+    Unhandled exceptions are logged and returned as "Error {action}: ..." so the client
+    sees a message instead of a failed call. Cross-cutting concerns for every tool
+    (timing, retries, metrics) belong here rather than in each handler.
+    """
+    error_prefix = f"Error {action}: "
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as error:
+                logger.error("Error %s: %s", action, error)
+                return error_prefix + str(error)
+            finally:
+                logger.info("%s finished in %.1fms", fn.__name__, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+# Largest page size the Todoist API accepts for list endpoints
+MAX_PAGE_LIMIT = 200
+
+def clamp_limit(limit: int) -> int:
+    """Return `limit` if it is a valid page size, otherwise the API maximum"""
+    if 0 < limit <= MAX_PAGE_LIMIT:
+        return limit
+    logger.warning("Invalid limit %s, using API maximum of %s instead", limit, MAX_PAGE_LIMIT)
+    return MAX_PAGE_LIMIT
+
+async def bounded_gather(coros: Iterable[Awaitable[Any]], limit: int = 5) -> list[Any]:
+    """Run awaitables concurrently, at most `limit` at a time, returning results in order
+
+    Exceptions are returned in place of results so one failure doesn't cancel the batch.
+    The cap keeps bulk operations under Todoist's rate limit.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+class RateLimiter:
+    """Token bucket that lets `rate` acquisitions through per `period` seconds, allowing bursts up to `rate`
+
+    Callers beyond the budget wait for a token instead of sending a request the API would
+    reject with 429 and a Retry-After delay.
+    """
+
+    def __init__(self, rate: int, period: float):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        # Waiters queue in order; the lock is held while sleeping for the next token
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+class BatchLoader:
+    """Coalesce lookups by key made within a short window into a single fetch
+
+    A window with one distinct key calls load_one(key); a window with several calls
+    load_many(keys), which returns a {key: value} mapping. Keys missing from the mapping
+    (e.g. objects a list endpoint omits) fall back to load_one(key), so a lookup resolves
+    or fails the same way whether or not it happened to be batched.
+    The functions passed by the first caller of a window are used for the whole window.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._load_one: Callable[[Hashable], Awaitable[Any]] | None = None
+        self._load_many: Callable[[list[Hashable]], Awaitable[dict]] | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def load(
+        self,
+        key: Hashable,
+        load_one: Callable[[Hashable], Awaitable[Any]],
+        load_many: Callable[[list[Hashable]], Awaitable[dict]],
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            self._load_one, self._load_many = load_one, load_many
+            loop.call_later(self.delay, self._start_flush, loop)
+        future = self._pending.get(key)
+        if future is None:
+            future = self._pending[key] = loop.create_future()
+        # Shield so one cancelled caller doesn't cancel the result for others waiting on the key
+        return await asyncio.shield(future)
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Hold a reference so the flush isn't garbage collected while callers await it
+        task = loop.create_task(self._flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        # A new window may install other functions while this one awaits, so keep these
+        load_one, load_many = self._load_one, self._load_many
+        keys = list(pending)
+        try:
+            if len(keys) == 1:
+                results = {keys[0]: await load_one(keys[0])}
+            else:
+                logger.info("Coalesced %s lookups into one batch fetch", len(keys))
+                # Copy: the mapping may be a cached index that must not gain fallback results
+                results = dict(await load_many(keys))
+        except Exception as error:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        missing = [key for key in keys if key not in results]
+        if missing:
+            logger.info("Looking up %s keys missing from the batch fetch individually", len(missing))
+            outcomes = await asyncio.gather(*(load_one(key) for key in missing), return_exceptions=True)
+            results.update(zip(missing, outcomes))
+        for key, future in pending.items():
+            if future.done():
+                continue
+            if isinstance(results[key], Exception):
+                future.set_exception(results[key])
+            else:
+                future.set_result(results[key])
+
+class TTLCache:
+    """Small in-memory LRU cache whose entries expire after a fixed number of seconds
+
+    Shared through the lifespan context so repeated list calls within a burst of tool
+    invocations reuse one API response. Mutating handlers clear it after success.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # One fetch per missing key; concurrent callers for the same key await it instead of
+        # each hitting the API, while misses on different keys still run in parallel
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        # Bumped on pop/clear so a fetch that started before an invalidation isn't stored
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every pop() and clear(); unchanged means nothing was invalidated"""
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+        self._inflight.pop(key, None)
+        self._generation += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, calling fetch() once on a miss"""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            logger.info("Cache hit for %s", key)
+            return value
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._inflight[key] = asyncio.ensure_future(self._fetch(key, fetch))
+            future.add_done_callback(lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+        else:
+            logger.info("Joining in-flight fetch for %s", key)
+        # Shield so one cancelled caller doesn't cancel the fetch for others waiting on the key
+        return await asyncio.shield(future)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self._generation
+        value = await fetch()
+        if generation == self._generation:
+            self.set(key, value)
+        return value